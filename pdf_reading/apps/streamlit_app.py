@@ -12,6 +12,33 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from llm_pdf_reading.orchestrator import PDFReadingOrchestrator
 
+@st.cache_resource
+def get_orchestrator() -> PDFReadingOrchestrator:
+    """Cria o orquestrador (agentes e LLM) uma única vez por processo"""
+    return PDFReadingOrchestrator()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def process_uploaded_pdf(file_bytes: bytes) -> dict:
+    """
+    Processa o PDF enviado, reaproveitando o resultado para o mesmo conteúdo.
+    Falhas são levantadas como RuntimeError para não ficarem no cache.
+    """
+    # Salvar arquivo temporariamente
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
+        tmp_file.write(file_bytes)
+        tmp_file_path = tmp_file.name
+    
+    try:
+        result = get_orchestrator().process_pdf(tmp_file_path)
+    finally:
+        # Limpar arquivo temporário
+        if os.path.exists(tmp_file_path):
+            os.unlink(tmp_file_path)
+    
+    if not result["success"]:
+        raise RuntimeError(result["error"])
+    return result
+
 def main():
     st.title("🤖 LLM PDF Reading - Análise Inteligente de PDFs")
     st.markdown("Faça upload de um PDF e deixe nossa IA analisar o conteúdo para você!")
@@ -38,90 +65,79 @@ def main():
     )
     
     if uploaded_file is not None:
-        # Salvar arquivo temporariamente
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_file_path = tmp_file.name
+        # Mostrar informações do arquivo
+        st.info(f"📄 Arquivo: {uploaded_file.name} ({uploaded_file.size} bytes)")
         
-        try:
-            # Mostrar informações do arquivo
-            st.info(f"📄 Arquivo: {uploaded_file.name} ({uploaded_file.size} bytes)")
-            
-            # Botão para processar
-            if st.button("🚀 Processar PDF", type="primary"):
-                with st.spinner("Processando PDF... Isso pode levar alguns momentos."):
-                    # Inicializar orquestrador
-                    orchestrator = PDFReadingOrchestrator()
+        # Botão para processar
+        if st.button("🚀 Processar PDF", type="primary"):
+            with st.spinner("Processando PDF... Isso pode levar alguns momentos."):
+                # Processar PDF (resultado em cache para o mesmo arquivo)
+                try:
+                    result = process_uploaded_pdf(uploaded_file.getvalue())
+                except RuntimeError as e:
+                    result = {"success": False, "error": str(e)}
+                
+                if result["success"]:
+                    # Mostrar resultados
+                    st.success("✅ PDF processado com sucesso!")
                     
-                    # Processar PDF
-                    result = orchestrator.process_pdf(tmp_file_path)
+                    # Tabs para diferentes visualizações
+                    tab1, tab2, tab3, tab4 = st.tabs(["📊 Análise", "📝 Conteúdo", "📋 Metadados", "❓ Perguntas"])
                     
-                    if result["success"]:
-                        # Mostrar resultados
-                        st.success("✅ PDF processado com sucesso!")
-                        
-                        # Tabs para diferentes visualizações
-                        tab1, tab2, tab3, tab4 = st.tabs(["📊 Análise", "📝 Conteúdo", "📋 Metadados", "❓ Perguntas"])
+                    with tab1:
+                        st.subheader("Análise do Documento")
+                        analysis = result["analysis"]
                         
-                        with tab1:
-                            st.subheader("Análise do Documento")
-                            analysis = result["analysis"]
-                            
-                            col1, col2, col3 = st.columns(3)
-                            with col1:
-                                st.metric("Palavras", analysis["word_count"])
-                            with col2:
-                                st.metric("Caracteres", analysis["character_count"])
-                            with col3:
-                                st.metric("Tempo de Leitura (min)", analysis["estimated_reading_time"])
-                            
-                            st.write("**Tópicos Principais:**")
-                            for topic in analysis["key_topics"]:
-                                st.write(f"• {topic}")
-                            
-                            st.write("**Resumo:**")
-                            st.write(analysis["summary"])
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.metric("Palavras", analysis["word_count"])
+                        with col2:
+                            st.metric("Caracteres", analysis["character_count"])
+                        with col3:
+                            st.metric("Tempo de Leitura (min)", analysis["estimated_reading_time"])
                         
-                        with tab2:
-                            st.subheader("Conteúdo Extraído")
-                            st.text_area(
-                                "Texto do PDF",
-                                result["content"],
-                                height=400,
-                                disabled=True
-                            )
-                            
-                            st.write(f"**Total de chunks criados:** {len(result['chunks'])}")
+                        st.write("**Tópicos Principais:**")
+                        for topic in analysis["key_topics"]:
+                            st.write(f"• {topic}")
                         
-                        with tab3:
-                            st.subheader("Metadados do Arquivo")
-                            metadata = result["metadata"]
-                            if metadata:
-                                for key, value in metadata.items():
-                                    st.write(f"**{key}:** {value}")
-                            else:
-                                st.write("Nenhum metadado encontrado.")
+                        st.write("**Resumo:**")
+                        st.write(analysis["summary"])
+                    
+                    with tab2:
+                        st.subheader("Conteúdo Extraído")
+                        st.text_area(
+                            "Texto do PDF",
+                            result["content"],
+                            height=400,
+                            disabled=True
+                        )
                         
-                        with tab4:
-                            st.subheader("Faça Perguntas sobre o Documento")
-                            question = st.text_input(
-                                "Digite sua pergunta:",
-                                placeholder="Ex: Qual é o tema principal do documento?"
-                            )
-                            
-                            if st.button("Responder") and question:
-                                with st.spinner("Gerando resposta..."):
-                                    answer = orchestrator.answer_question(result["content"], question)
-                                    st.write("**Resposta:**")
-                                    st.write(answer)
+                        st.write(f"**Total de chunks criados:** {len(result['chunks'])}")
                     
-                    else:
-                        st.error(f"❌ Erro ao processar PDF: {result['error']}")
-        
-        finally:
-            # Limpar arquivo temporário
-            if os.path.exists(tmp_file_path):
-                os.unlink(tmp_file_path)
+                    with tab3:
+                        st.subheader("Metadados do Arquivo")
+                        metadata = result["metadata"]
+                        if metadata:
+                            for key, value in metadata.items():
+                                st.write(f"**{key}:** {value}")
+                        else:
+                            st.write("Nenhum metadado encontrado.")
+                    
+                    with tab4:
+                        st.subheader("Faça Perguntas sobre o Documento")
+                        question = st.text_input(
+                            "Digite sua pergunta:",
+                            placeholder="Ex: Qual é o tema principal do documento?"
+                        )
+                        
+                        if st.button("Responder") and question:
+                            with st.spinner("Gerando resposta..."):
+                                answer = get_orchestrator().answer_question(result["content"], question)
+                                st.write("**Resposta:**")
+                                st.write(answer)
+                
+                else:
+                    st.error(f"❌ Erro ao processar PDF: {result['error']}")
     
     # Informações na sidebar
     with st.sidebar:
@@ -2,15 +2,38 @@
 LLM PDF Reading - Sistema de leitura e análise de PDFs usando LLMs e CrewAI
 """
 
+import importlib
+
 from .config import *
-from .pdf_utils import PDFProcessor
-from .orchestrator import PDFReadingOrchestrator
 
 __version__ = "0.0.1"
 __author__ = "sergio_alves_da_cruz"
 
+# Classes principais importadas sob demanda: evita carregar PyMuPDF, CrewAI e
+# LangChain apenas por importar o pacote (ex.: para ler as configurações)
+_LAZY_IMPORTS = {
+    "PDFProcessor": ".pdf_utils",
+    "PDFReadingOrchestrator": ".orchestrator",
+}
+
+
+def __getattr__(name):
+    """Importa as classes principais no primeiro acesso (PEP 562)"""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Inclui as classes importadas sob demanda na listagem do módulo"""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 # Exportar classes principais
-__all__ = [
+__all__ = [  # noqa: F405
     "PDFProcessor",
     "PDFReadingOrchestrator",
-]
\ No newline at end of file
+]
@@ -12,8 +12,12 @@ logger = logging.getLogger(__name__)
 class PDFReadingOrchestrator:
     """Orquestrador principal para leitura e análise de PDFs"""
     
-    def __init__(self, llm=None):
-        self.pdf_processor = PDFProcessor()
+    def __init__(self, llm=None, parallel_min_pages: Optional[int] = None, cache_size: int = 0):
+        # parallel_min_pages habilita a extração multiprocesso e cache_size o cache
+        # de textos extraídos (ver PDFProcessor)
+        self.pdf_processor = PDFProcessor(
+            parallel_min_pages=parallel_min_pages, cache_size=cache_size
+        )
         self.agents = PDFAnalysisAgents(llm)
         self.tasks = PDFAnalysisTasks()
         
@@ -22,7 +26,7 @@ class PDFReadingOrchestrator:
         self.content_analyzer = self.agents.create_content_analyzer_agent()
         self.qa_agent = self.agents.create_qa_agent()
     
-    def process_pdf(self, pdf_path: str) -> Dict[str, Any]:
+    def process_pdf(self, pdf_path: str, max_pages: Optional[int] = None) -> Dict[str, Any]:
         """Processa um arquivo PDF completo"""
         try:
             pdf_path = Path(pdf_path)
@@ -32,8 +36,8 @@ class PDFReadingOrchestrator:
                 raise FileNotFoundError(f"Arquivo não encontrado: {pdf_path}")
             
             # Extrair texto
-            logger.info(f"Extraindo texto de: {pdf_path}")
-            text_content = self.pdf_processor.extract_text_pymupdf(pdf_path)
+            logger.info("Extraindo texto de: %s", pdf_path)
+            text_content = self.pdf_processor.extract_text_pymupdf(pdf_path, max_pages=max_pages)
             
             if not text_content.strip():
                 raise ValueError("Não foi possível extrair texto do PDF")
@@ -57,7 +61,7 @@ class PDFReadingOrchestrator:
             }
             
         except Exception as e:
-            logger.error(f"Erro ao processar PDF: {e}")
+            logger.error("Erro ao processar PDF: %s", e)
             return {
                 "file_path": str(pdf_path) if 'pdf_path' in locals() else "unknown",
                 "error": str(e),
@@ -71,7 +75,7 @@ class PDFReadingOrchestrator:
             # Em produção, usaria CrewAI para processar
             return f"Baseado no conteúdo do PDF, para a pergunta '{question}': [Resposta seria gerada pelo LLM]"
         except Exception as e:
-            logger.error(f"Erro ao responder pergunta: {e}")
+            logger.error("Erro ao responder pergunta: %s", e)
             return f"Erro ao processar pergunta: {e}"
     
     def _analyze_content(self, content: str) -> Dict[str, Any]:
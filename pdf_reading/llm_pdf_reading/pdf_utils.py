@@ -3,44 +3,119 @@ Utilitários para processamento de PDFs
 """
 import PyPDF2
 import fitz  # PyMuPDF
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
+from collections import OrderedDict
+from multiprocessing import Pool, cpu_count
 import logging
+import os
+import threading
 
 logger = logging.getLogger(__name__)
 
+def _extract_page_range(args) -> str:
+    """Extrai o texto de um intervalo de páginas (executado em um processo separado)"""
+    pdf_path, start, end = args
+    # Documentos PyMuPDF não são serializáveis: cada processo abre o seu
+    doc = fitz.open(pdf_path)
+    try:
+        return "".join(doc[page_num].get_text() + "\n" for page_num in range(start, end))
+    finally:
+        doc.close()
+
 class PDFProcessor:
     """Classe para processar arquivos PDF"""
     
-    def __init__(self):
+    def __init__(self, parallel_min_pages: Optional[int] = None, cache_size: int = 0):
         self.supported_formats = ['.pdf']
+        # A partir deste número de páginas a extração é dividida entre processos (None desativa)
+        self.parallel_min_pages = parallel_min_pages
+        # Quantos textos extraídos manter em cache, por caminho, mtime e tamanho (0 desativa)
+        self.cache_size = cache_size
+        self._text_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        # O processador pode ser compartilhado entre threads (ex.: Streamlit)
+        self._cache_lock = threading.Lock()
     
     def extract_text_pypdf2(self, pdf_path: Path) -> str:
         """Extrai texto usando PyPDF2"""
         try:
-            text = ""
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            return text
+                pages = [page.extract_text() + "\n" for page in pdf_reader.pages]
+            return "".join(pages)
         except Exception as e:
-            logger.error(f"Erro ao extrair texto com PyPDF2: {e}")
+            logger.error("Erro ao extrair texto com PyPDF2: %s", e)
             return ""
     
-    def extract_text_pymupdf(self, pdf_path: Path) -> str:
+    def extract_text_pymupdf(self, pdf_path: Path, max_pages: Optional[int] = None) -> str:
         """Extrai texto usando PyMuPDF (melhor qualidade)"""
+        if max_pages is not None and max_pages < 0:
+            raise ValueError(f"max_pages deve ser maior ou igual a zero: {max_pages}")
+        
         try:
-            text = ""
+            cache_key = None
+            if self.cache_size > 0:
+                # Caminho, mtime e tamanho identificam a versão do arquivo no cache
+                stat = os.stat(pdf_path)
+                cache_key = (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size, max_pages)
+                with self._cache_lock:
+                    cached_text = self._text_cache.get(cache_key)
+                    if cached_text is not None:
+                        self._text_cache.move_to_end(cache_key)
+                        return cached_text
+            
             doc = fitz.open(pdf_path)
-            for page in doc:
-                text += page.get_text() + "\n"
-            doc.close()
+            page_count = doc.page_count
+            if max_pages is not None:
+                page_count = min(page_count, max_pages)
+            if page_count == 0:
+                doc.close()
+                return ""
+            if (
+                self.parallel_min_pages is not None
+                and page_count >= self.parallel_min_pages
+                and cpu_count() > 1
+            ):
+                doc.close()
+                text = self._extract_text_pymupdf_parallel(pdf_path, page_count)
+            else:
+                pages = []
+                for page in doc:
+                    # Interrompe a iteração em vez de usar doc.select(), que altera a árvore de páginas
+                    if page.number >= page_count:
+                        break
+                    pages.append(page.get_text() + "\n")
+                doc.close()
+                text = "".join(pages)
+            
+            if cache_key is not None:
+                with self._cache_lock:
+                    self._text_cache[cache_key] = text
+                    if len(self._text_cache) > self.cache_size:
+                        self._text_cache.popitem(last=False)
             return text
         except Exception as e:
-            logger.error(f"Erro ao extrair texto com PyMuPDF: {e}")
+            logger.error("Erro ao extrair texto com PyMuPDF: %s", e)
             return ""
     
+    def _extract_text_pymupdf_parallel(self, pdf_path: Path, page_count: int) -> str:
+        """
+        Extrai texto com PyMuPDF dividindo as páginas entre processos.
+        Iniciar o pool custa centenas de milissegundos com o método "spawn" (padrão
+        no Windows e no macOS), então só compensa em documentos grandes. Com "spawn",
+        o script chamador precisa da proteção ``if __name__ == "__main__":``, pois
+        cada processo reimporta o módulo principal.
+        """
+        processes = min(cpu_count(), page_count)
+        step = -(-page_count // processes)
+        ranges = [
+            (str(pdf_path), start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        with Pool(len(ranges)) as pool:
+            # map preserva a ordem dos intervalos, logo a ordem das páginas
+            return "".join(pool.map(_extract_page_range, ranges))
+    
     def extract_metadata(self, pdf_path: Path) -> Dict[str, Any]:
         """Extrai metadados do PDF"""
         try:
@@ -49,7 +124,7 @@ class PDFProcessor:
             doc.close()
             return metadata
         except Exception as e:
-            logger.error(f"Erro ao extrair metadados: {e}")
+            logger.error("Erro ao extrair metadados: %s", e)
             return {}
     
     def split_into_chunks(self, text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
@@ -6,4 +6,4 @@ echo.
 pause
 
 cd /d "%~dp0.."
-streamlit run apps/streamlit_app.py
+streamlit run apps/streamlit_app.py --server.fileWatcherType none --browser.gatherUsageStats false
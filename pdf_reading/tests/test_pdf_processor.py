@@ -5,11 +5,23 @@ import pytest
 from pathlib import Path
 import tempfile
 import sys
+import os
 
 # Adicionar o diretório do projeto ao path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from llm_pdf_reading import pdf_utils
 from llm_pdf_reading.pdf_utils import PDFProcessor
+import fitz  # PyMuPDF
+
+def write_pdf(pdf_path: Path, page_texts) -> Path:
+    """Cria um PDF com uma página por texto informado"""
+    doc = fitz.open()
+    for page_text in page_texts:
+        doc.new_page().insert_text((72, 72), page_text)
+    doc.save(pdf_path)
+    doc.close()
+    return pdf_path
 
 class TestPDFProcessor:
     """Testes para a classe PDFProcessor"""
@@ -44,5 +56,62 @@ class TestPDFProcessor:
         assert len(chunks) == 1
         assert chunks[0] == text
     
+    def test_extract_text_pymupdf_parallel_matches_serial(self, tmp_path, monkeypatch):
+        """Testa se a extração paralela preserva o texto e a ordem das páginas"""
+        pdf_path = write_pdf(tmp_path / "paginas.pdf", [f"Pagina {n}" for n in range(6)])
+        monkeypatch.setattr(pdf_utils, "cpu_count", lambda: 4)
+        
+        serial = PDFProcessor().extract_text_pymupdf(pdf_path)
+        parallel = PDFProcessor(parallel_min_pages=2).extract_text_pymupdf(pdf_path)
+        
+        assert parallel == serial
+        assert serial.index("Pagina 0") < serial.index("Pagina 5")
+    
+    def test_extract_text_pymupdf_parallel_max_pages(self, tmp_path, monkeypatch):
+        """Testa se max_pages também limita a extração paralela"""
+        pdf_path = write_pdf(tmp_path / "paginas.pdf", [f"Pagina {n}" for n in range(6)])
+        monkeypatch.setattr(pdf_utils, "cpu_count", lambda: 4)
+        
+        text = PDFProcessor(parallel_min_pages=2).extract_text_pymupdf(pdf_path, max_pages=3)
+        
+        assert "Pagina 2" in text
+        assert "Pagina 3" not in text
+    
+    def test_extract_text_pymupdf_max_pages(self, tmp_path):
+        """Testa se max_pages limita as páginas extraídas"""
+        pdf_path = write_pdf(tmp_path / "paginas.pdf", [f"Pagina {n}" for n in range(3)])
+        
+        text = self.processor.extract_text_pymupdf(pdf_path, max_pages=2)
+        
+        assert "Pagina 1" in text
+        assert "Pagina 2" not in text
+    
+    def test_extract_text_pymupdf_negative_max_pages(self, tmp_path):
+        """Testa se max_pages negativo é rejeitado"""
+        with pytest.raises(ValueError):
+            self.processor.extract_text_pymupdf(tmp_path / "qualquer.pdf", max_pages=-1)
+    
+    def test_extract_text_pymupdf_cache(self, tmp_path):
+        """Testa se o texto é reaproveitado e invalidado quando o arquivo muda"""
+        processor = PDFProcessor(cache_size=4)
+        pdf_path = write_pdf(tmp_path / "cache.pdf", ["Primeira versao"])
+        first = processor.extract_text_pymupdf(pdf_path)
+        assert processor.extract_text_pymupdf(pdf_path) is first
+        
+        write_pdf(pdf_path, ["Segunda versao do arquivo"])
+        stat = pdf_path.stat()
+        os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert "Segunda versao" in processor.extract_text_pymupdf(pdf_path)
+    
+    def test_extract_text_pymupdf_cache_disabled_by_default(self, tmp_path):
+        """Testa se o cache de textos fica desativado por padrão"""
+        pdf_path = write_pdf(tmp_path / "sem_cache.pdf", ["Texto"])
+        
+        first = self.processor.extract_text_pymupdf(pdf_path)
+        second = self.processor.extract_text_pymupdf(pdf_path)
+        
+        assert first == second
+        assert first is not second
+    
     # Nota: Testes com PDFs reais requerem arquivos de exemplo
     # Estes podem ser adicionados quando houver arquivos de teste disponíveis